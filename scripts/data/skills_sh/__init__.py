@@ -0,0 +1,60 @@
+"""Importable skills.sh data pipeline: fetch, parse, dedupe, enrich, publish.
+
+Submodules are loaded on first attribute access so importing the package (or
+running the CLI with `--help`) does not pull in `urllib`, `html.parser` or the
+curated domain tables until they are needed.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "BASE_URL": "constants",
+    "DEFAULT_OUTPUT_DIR": "constants",
+    "PUBLIC_DATA_DIRS": "constants",
+    "TRENDING_URL": "constants",
+    "CORE_DOMAINS": "domains",
+    "fetch_text": "fetch",
+    "fetch_trending_html": "fetch",
+    "fetch_skills": "fetch",
+    "iter_trending_skills": "fetch",
+    "iter_all_time_skills": "fetch",
+    "extract_array": "parse",
+    "parse_skills": "parse",
+    "iter_skills": "parse",
+    "dedupe_skills": "parse",
+    "add_urls": "parse",
+    "iter_with_urls": "parse",
+    "index_skills": "parse",
+    "skill_key": "parse",
+    "load_star_cache": "enrich",
+    "fetch_repo_stars": "enrich",
+    "load_summary_cache": "enrich",
+    "fetch_skill_summary": "enrich",
+    "get_skill_summary": "enrich",
+    "build_core_domains": "enrich",
+    "render_markdown": "publish",
+    "publish_core_domains": "publish",
+    "write_json": "publish",
+    "fingerprint_domains": "incremental",
+    "load_fingerprints": "incremental",
+    "build_core_domains_incremental": "incremental",
+    "iter_json_array": "outputs",
+    "iter_output_skills": "outputs",
+    "load_core_domains": "outputs",
+    "main": "cli",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
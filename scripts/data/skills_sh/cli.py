@@ -0,0 +1,189 @@
+"""Command line entry point for the skills.sh data pipeline.
+
+Only `argparse` is imported up front; the fetch/enrich/publish modules are
+loaded inside `run` so `--help` and argument errors return immediately.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from .constants import (
+    ALL_TIME_FILE,
+    CORE_DOMAINS_FILE,
+    CORE_DOMAINS_MARKDOWN_FILE,
+    DEFAULT_OUTPUT_DIR,
+    FINGERPRINTS_FILE,
+    PUBLIC_DATA_DIRS,
+    STAR_CACHE_FILE,
+    SUMMARY_CACHE_FILE,
+    TRENDING_FILE,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Fetch skills data from skills.sh")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Output directory")
+    parser.add_argument("--skip-stars", action="store_true", help="Skip GitHub stars fetch")
+    parser.add_argument("--skip-summaries", action="store_true", help="Skip SKILL.md summary fetch")
+    parser.add_argument(
+        "--refresh-summaries",
+        action="store_true",
+        help="Refresh cached SKILL.md summaries",
+    )
+    parser.add_argument(
+        "--summary-sleep",
+        type=float,
+        default=0.3,
+        help="Delay between summary fetches (seconds)",
+    )
+    parser.add_argument(
+        "--skip-public",
+        action="store_true",
+        help="Skip writing public JSON for the web/console apps",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rebuild only core domains whose inputs changed since the last run",
+    )
+    return parser
+
+
+def run(args: argparse.Namespace) -> None:
+    from datetime import datetime, timezone
+
+    from .constants import ALL_TIME_KEY, TRENDING_KEY, TRENDING_URL
+    from .domains import CORE_DOMAINS
+    from .enrich import (
+        build_core_domains,
+        core_repos,
+        fetch_repo_stars,
+        load_star_cache,
+        load_summary_cache,
+    )
+    from .fetch import fetch_skills, fetch_trending_html
+    from .parse import add_urls, index_skills
+    from .publish import (
+        publish_core_domains,
+        render_markdown,
+        splice_markdown,
+        write_json,
+        write_text,
+    )
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    html = fetch_trending_html()
+    all_time = fetch_skills(ALL_TIME_KEY, html)
+    trending = fetch_skills(TRENDING_KEY, html)
+
+    all_time_map = index_skills(all_time)
+    trending_map = index_skills(trending)
+
+    star_cache_path = output_dir / STAR_CACHE_FILE
+    star_cache = load_star_cache(star_cache_path)
+    summary_cache_path = output_dir / SUMMARY_CACHE_FILE
+    summary_cache = load_summary_cache(summary_cache_path)
+
+    if not args.skip_stars:
+        star_cache = fetch_repo_stars(core_repos(), star_cache)
+        write_json(star_cache_path, star_cache)
+
+    write_json(output_dir / ALL_TIME_FILE, add_urls(all_time))
+    write_json(output_dir / TRENDING_FILE, add_urls(trending))
+
+    fingerprints_path = output_dir / FINGERPRINTS_FILE
+    markdown_path = output_dir / CORE_DOMAINS_MARKDOWN_FILE
+
+    if args.incremental:
+        from .incremental import build_core_domains_incremental, load_fingerprints
+        from .outputs import load_core_domains
+
+        previous_payload = load_core_domains(output_dir)
+        previous_fingerprints = load_fingerprints(fingerprints_path)
+        core_domains, rebuilt_ids, fingerprints = build_core_domains_incremental(
+            previous_payload,
+            previous_fingerprints,
+            all_time_map,
+            trending_map,
+            star_cache,
+            summary_cache,
+            skip_summaries=args.skip_summaries,
+            refresh_summaries=args.refresh_summaries,
+            summary_sleep_seconds=args.summary_sleep,
+        )
+        previous_ids = [d["id"] for d in previous_payload["domains"]] if previous_payload else []
+        current_ids = [d["id"] for d in core_domains]
+        dropped_ids = [domain_id for domain_id in previous_ids if domain_id not in current_ids]
+        if rebuilt_ids:
+            print(f"Recomputed core domains: {', '.join(rebuilt_ids)}")
+        if dropped_ids:
+            print(f"Dropped core domains: {', '.join(dropped_ids)}")
+        public_current = args.skip_public or (
+            previous_fingerprints.get("skipPublic") is False
+            and all((public_dir / CORE_DOMAINS_FILE).exists() for public_dir in PUBLIC_DATA_DIRS)
+        )
+        if not rebuilt_ids and previous_ids == current_ids:
+            if markdown_path.exists() and public_current:
+                print("Core domains unchanged; outputs left as is")
+                return
+            print("Core domains unchanged; rewriting missing or stale outputs")
+    else:
+        from .incremental import fingerprint_domains, fingerprint_manifest
+
+        core_domains = build_core_domains(
+            all_time_map,
+            trending_map,
+            star_cache,
+            summary_cache,
+            skip_summaries=args.skip_summaries,
+            refresh_summaries=args.refresh_summaries,
+            summary_sleep_seconds=args.summary_sleep,
+        )
+        rebuilt_ids = None
+        fingerprints = fingerprint_manifest(
+            fingerprint_domains(
+                CORE_DOMAINS,
+                all_time_map,
+                trending_map,
+                star_cache,
+                summary_cache,
+                skip_summaries=args.skip_summaries,
+            ),
+            args.skip_summaries,
+        )
+    fingerprints["skipPublic"] = args.skip_public
+
+    payload = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "source": TRENDING_URL,
+        "domains": core_domains,
+    }
+
+    write_json(output_dir / CORE_DOMAINS_FILE, payload)
+
+    summary_cache["generatedAt"] = datetime.now(timezone.utc).isoformat()
+    write_json(summary_cache_path, summary_cache)
+
+    if not args.skip_public:
+        publish_core_domains(payload)
+
+    if rebuilt_ids is not None and markdown_path.exists():
+        markdown = splice_markdown(payload, rebuilt_ids, markdown_path.read_text(encoding="utf-8"))
+    else:
+        markdown = render_markdown(payload)
+    write_text(markdown_path, markdown)
+    write_json(fingerprints_path, fingerprints)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
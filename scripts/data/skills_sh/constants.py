@@ -0,0 +1,24 @@
+"""Endpoints and default locations shared by the skills.sh data pipeline."""
+
+from pathlib import Path
+
+BASE_URL = "https://skills.sh"
+TRENDING_URL = f"{BASE_URL}/trending"
+GITHUB_REPO_API = "https://api.github.com/repos/{}"
+USER_AGENT = "skild-data-collector/0.1"
+DEFAULT_OUTPUT_DIR = Path("data/skills-sh")
+PUBLIC_DATA_DIRS = [
+    Path("apps/web/public/data"),
+    Path("apps/console/public/data"),
+]
+
+ALL_TIME_KEY = "allTimeSkills"
+TRENDING_KEY = "trendingSkills"
+
+ALL_TIME_FILE = "skills-all-time.json"
+TRENDING_FILE = "skills-trending.json"
+CORE_DOMAINS_FILE = "skills-core-domains.json"
+CORE_DOMAINS_MARKDOWN_FILE = "skills-core-domains.md"
+STAR_CACHE_FILE = "repo-stars.json"
+SUMMARY_CACHE_FILE = "skills-core-summaries.json"
+FINGERPRINTS_FILE = "skills-core-fingerprints.json"
@@ -0,0 +1,315 @@
+"""Curated core domains rendered into the Hub core-domains outputs."""
+
+CORE_DOMAINS = [
+    {
+        "id": "agent-workflow",
+        "name": "Agent Discovery & Automation",
+        "focus": "Skill discovery, browser control, and automation workflows that answer: what should I use next?",
+        "skills": [
+            {
+                "source": "vercel-labs/skills",
+                "skillId": "find-skills",
+                "tags": ["discover", "search", "installation"],
+            },
+            {
+                "source": "vercel-labs/agent-browser",
+                "skillId": "agent-browser",
+                "tags": ["browser", "automation", "web"],
+            },
+            {
+                "source": "browser-use/browser-use",
+                "skillId": "browser-use",
+                "tags": ["browser", "workflow", "automation"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "skill-creator",
+                "tags": ["skill-authoring", "workflow", "governance"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "mcp-builder",
+                "tags": ["mcp", "integration", "tools"],
+            },
+            {
+                "source": "obra/superpowers",
+                "skillId": "subagent-driven-development",
+                "tags": ["agents", "collaboration", "workflow"],
+            },
+        ],
+    },
+    {
+        "id": "frontend-ui",
+        "name": "Frontend & UI/UX",
+        "focus": "Experience, performance, and maintainability across frontend frameworks and design systems.",
+        "skills": [
+            {
+                "source": "vercel-labs/agent-skills",
+                "skillId": "vercel-react-best-practices",
+                "tags": ["react", "nextjs", "performance"],
+            },
+            {
+                "source": "vercel-labs/agent-skills",
+                "skillId": "web-design-guidelines",
+                "tags": ["design", "ui", "ux"],
+            },
+            {
+                "source": "remotion-dev/skills",
+                "skillId": "remotion-best-practices",
+                "tags": ["video", "react", "motion"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "frontend-design",
+                "tags": ["frontend", "design", "usability"],
+            },
+            {
+                "source": "vercel-labs/agent-skills",
+                "skillId": "vercel-composition-patterns",
+                "tags": ["component", "architecture", "patterns"],
+            },
+            {
+                "source": "nextlevelbuilder/ui-ux-pro-max-skill",
+                "skillId": "ui-ux-pro-max",
+                "tags": ["ui", "ux", "design"],
+            },
+            {
+                "source": "hyf0/vue-skills",
+                "skillId": "vue-best-practices",
+                "tags": ["vue", "frontend", "best-practices"],
+            },
+        ],
+    },
+    {
+        "id": "mobile-native",
+        "name": "Mobile & Native",
+        "focus": "Mobile UX and native capabilities for React Native and Expo.",
+        "skills": [
+            {
+                "source": "vercel-labs/agent-skills",
+                "skillId": "vercel-react-native-skills",
+                "tags": ["react-native", "mobile", "best-practices"],
+            },
+            {
+                "source": "expo/skills",
+                "skillId": "building-native-ui",
+                "tags": ["expo", "mobile-ui", "native"],
+            },
+            {
+                "source": "expo/skills",
+                "skillId": "upgrading-expo",
+                "tags": ["expo", "upgrade", "maintenance"],
+            },
+            {
+                "source": "expo/skills",
+                "skillId": "native-data-fetching",
+                "tags": ["expo", "data", "networking"],
+            },
+            {
+                "source": "expo/skills",
+                "skillId": "expo-dev-client",
+                "tags": ["expo", "devtools", "debugging"],
+            },
+            {
+                "source": "callstackincubator/agent-skills",
+                "skillId": "react-native-best-practices",
+                "tags": ["react-native", "architecture", "performance"],
+            },
+        ],
+    },
+    {
+        "id": "backend-data",
+        "name": "Backend & Data",
+        "focus": "Databases, auth, and API design to keep backend systems stable and scalable.",
+        "skills": [
+            {
+                "source": "supabase/agent-skills",
+                "skillId": "supabase-postgres-best-practices",
+                "tags": ["postgres", "database", "supabase"],
+            },
+            {
+                "source": "better-auth/skills",
+                "skillId": "better-auth-best-practices",
+                "tags": ["auth", "security", "backend"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "api-design-principles",
+                "tags": ["api", "design", "backend"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "postgresql-table-design",
+                "tags": ["postgres", "schema", "database"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "sql-optimization-patterns",
+                "tags": ["sql", "performance", "database"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "openapi-spec-generation",
+                "tags": ["openapi", "api", "documentation"],
+            },
+        ],
+    },
+    {
+        "id": "devops-infra",
+        "name": "DevOps & Infra",
+        "focus": "Deployment pipelines and infrastructure automation for reliable delivery.",
+        "skills": [
+            {
+                "source": "expo/skills",
+                "skillId": "expo-deployment",
+                "tags": ["deployment", "expo", "release"],
+            },
+            {
+                "source": "expo/skills",
+                "skillId": "expo-cicd-workflows",
+                "tags": ["cicd", "automation", "expo"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "github-actions-templates",
+                "tags": ["ci", "github-actions", "automation"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "deployment-pipeline-design",
+                "tags": ["pipeline", "delivery", "devops"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "terraform-module-library",
+                "tags": ["terraform", "infra", "iac"],
+            },
+            {
+                "source": "sickn33/antigravity-awesome-skills",
+                "skillId": "docker-expert",
+                "tags": ["docker", "containers", "devops"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "k8s-manifest-generator",
+                "tags": ["kubernetes", "infra", "automation"],
+            },
+        ],
+    },
+    {
+        "id": "quality-testing",
+        "name": "Quality & Testing",
+        "focus": "Testing strategy, TDD, and quality guardrails to reduce regressions.",
+        "skills": [
+            {
+                "source": "anthropics/skills",
+                "skillId": "webapp-testing",
+                "tags": ["testing", "qa", "web"],
+            },
+            {
+                "source": "obra/superpowers",
+                "skillId": "test-driven-development",
+                "tags": ["tdd", "testing", "engineering"],
+            },
+            {
+                "source": "obra/superpowers",
+                "skillId": "systematic-debugging",
+                "tags": ["debugging", "diagnosis", "quality"],
+            },
+            {
+                "source": "softaworks/agent-toolkit",
+                "skillId": "qa-test-planner",
+                "tags": ["qa", "planning", "testing"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "python-testing-patterns",
+                "tags": ["python", "testing", "patterns"],
+            },
+            {
+                "source": "wshobson/agents",
+                "skillId": "e2e-testing-patterns",
+                "tags": ["e2e", "testing", "automation"],
+            },
+        ],
+    },
+    {
+        "id": "growth-content",
+        "name": "Growth & Marketing",
+        "focus": "Growth, copywriting, and SEO to drive acquisition and conversion.",
+        "skills": [
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "seo-audit",
+                "tags": ["seo", "marketing", "growth"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "copywriting",
+                "tags": ["copywriting", "content", "conversion"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "marketing-psychology",
+                "tags": ["marketing", "psychology", "positioning"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "programmatic-seo",
+                "tags": ["seo", "automation", "growth"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "marketing-ideas",
+                "tags": ["ideation", "growth", "marketing"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "pricing-strategy",
+                "tags": ["pricing", "strategy", "growth"],
+            },
+            {
+                "source": "coreyhaines31/marketingskills",
+                "skillId": "social-content",
+                "tags": ["social", "content", "distribution"],
+            },
+        ],
+    },
+    {
+        "id": "docs-office",
+        "name": "Docs & Office",
+        "focus": "Document and spreadsheet workflows for extraction and reporting.",
+        "skills": [
+            {
+                "source": "anthropics/skills",
+                "skillId": "pdf",
+                "tags": ["pdf", "docs", "extraction"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "pptx",
+                "tags": ["pptx", "slides", "docs"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "xlsx",
+                "tags": ["xlsx", "spreadsheet", "data"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "docx",
+                "tags": ["docx", "docs", "authoring"],
+            },
+            {
+                "source": "anthropics/skills",
+                "skillId": "doc-coauthoring",
+                "tags": ["docs", "collaboration", "workflow"],
+            },
+            {
+                "source": "onmax/nuxt-skills",
+                "skillId": "document-writer",
+                "tags": ["writing", "docs", "automation"],
+            },
+        ],
+    },
+]
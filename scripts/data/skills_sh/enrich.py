@@ -0,0 +1,146 @@
+"""Enrich the curated core domains with installs, GitHub stars and summaries."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .constants import BASE_URL, GITHUB_REPO_API
+from .domains import CORE_DOMAINS
+from .fetch import fetch_text
+from .parse import Skill, SkillKey
+
+Cache = Dict[str, Any]
+
+SUMMARY_FALLBACK = "SKILL.md summary unavailable"
+
+
+def load_star_cache(path: Path) -> Cache:
+    if path.exists():
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    return {
+        "generatedAt": None,
+        "repos": {},
+    }
+
+
+def core_repos(domains: Iterable[Mapping[str, Any]] = CORE_DOMAINS) -> set:
+    return {item["source"] for domain in domains for item in domain["skills"]}
+
+
+def fetch_repo_stars(repos: Iterable[str], cache: Cache, sleep_seconds: float = 0.8) -> Cache:
+    for repo in sorted(repos):
+        if repo in cache["repos"]:
+            continue
+        url = GITHUB_REPO_API.format(repo)
+        try:
+            payload = json.loads(fetch_text(url))
+            cache["repos"][repo] = payload.get("stargazers_count")
+        except Exception:
+            cache["repos"][repo] = None
+        time.sleep(sleep_seconds)
+    cache["generatedAt"] = datetime.now(timezone.utc).isoformat()
+    return cache
+
+
+def load_summary_cache(path: Path) -> Cache:
+    if path.exists():
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    return {
+        "generatedAt": None,
+        "summaries": {},
+    }
+
+
+def fetch_skill_summary(skill_url: str) -> Optional[str]:
+    try:
+        html = fetch_text(skill_url)
+    except Exception:
+        return None
+    from .summary_parser import first_paragraph
+
+    return first_paragraph(html)
+
+
+def get_skill_summary(
+    skill_key: str,
+    skill_url: str,
+    cache: Cache,
+    refresh: bool = False,
+    sleep_seconds: float = 0.3,
+) -> Optional[str]:
+    cached = cache["summaries"].get(skill_key)
+    if cached and cached.get("summary") and not refresh:
+        return cached["summary"]
+    summary = fetch_skill_summary(skill_url)
+    cache["summaries"][skill_key] = {
+        "summary": summary,
+        "skillUrl": skill_url,
+        "fetchedAt": datetime.now(timezone.utc).isoformat(),
+    }
+    time.sleep(sleep_seconds)
+    return summary
+
+
+def build_core_domains(
+    all_time_map: Mapping[SkillKey, Skill],
+    trending_map: Mapping[SkillKey, Skill],
+    star_cache: Cache,
+    summary_cache: Cache,
+    skip_summaries: bool = False,
+    refresh_summaries: bool = False,
+    summary_sleep_seconds: float = 0.3,
+    domains: Iterable[Mapping[str, Any]] = CORE_DOMAINS,
+) -> List[Dict[str, Any]]:
+    output = []
+    for domain in domains:
+        skills = []
+        for item in domain["skills"]:
+            key = (item["source"], item["skillId"])
+            all_time = all_time_map.get(key)
+            trending = trending_map.get(key)
+            skill_key = f"{item['source']}/{item['skillId']}"
+            skill_url = f"{BASE_URL}/{item['source']}/{item['skillId']}"
+            summary = None
+            summary_source = None
+            if not skip_summaries:
+                summary = get_skill_summary(
+                    skill_key,
+                    skill_url,
+                    summary_cache,
+                    refresh=refresh_summaries,
+                    sleep_seconds=summary_sleep_seconds,
+                )
+                if summary:
+                    summary_source = "skills.sh"
+            if not summary:
+                summary = SUMMARY_FALLBACK
+                summary_source = "fallback"
+            entry = {
+                "source": item["source"],
+                "skillId": item["skillId"],
+                "name": all_time.get("name") if all_time else item["skillId"],
+                "installsAllTime": all_time.get("installs") if all_time else None,
+                "installsTrending": trending.get("installs") if trending else None,
+                "skillUrl": skill_url,
+                "repoUrl": f"https://github.com/{item['source']}",
+                "repoStars": star_cache["repos"].get(item["source"]),
+                "tags": item["tags"],
+                "summary": summary,
+                "summarySource": summary_source,
+            }
+            skills.append(entry)
+        output.append(
+            {
+                "id": domain["id"],
+                "name": domain["name"],
+                "focus": domain["focus"],
+                "skills": skills,
+            }
+        )
+    return output
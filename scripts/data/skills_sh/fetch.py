@@ -0,0 +1,39 @@
+"""Network access to skills.sh.
+
+`urllib.request` pulls in `http.client`, `ssl` and friends, so it is imported
+on first use rather than at module import time.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Optional
+
+from .constants import ALL_TIME_KEY, TRENDING_KEY, TRENDING_URL, USER_AGENT
+from .parse import Skill, dedupe_skills, iter_skills
+
+
+def fetch_text(url: str, timeout: float = 30) -> str:
+    from urllib.request import Request, urlopen
+
+    req = Request(url, headers={"User-Agent": USER_AGENT})
+    with urlopen(req, timeout=timeout) as resp:
+        return resp.read().decode("utf-8")
+
+
+def fetch_trending_html() -> str:
+    return fetch_text(TRENDING_URL)
+
+
+def fetch_skills(key: str, html: Optional[str] = None) -> List[Skill]:
+    """Return the deduped skills list for `key`, fetching the page if needed."""
+    if html is None:
+        html = fetch_trending_html()
+    return dedupe_skills(iter_skills(html, key))
+
+
+def iter_trending_skills(html: Optional[str] = None) -> Iterator[Skill]:
+    yield from fetch_skills(TRENDING_KEY, html)
+
+
+def iter_all_time_skills(html: Optional[str] = None) -> Iterator[Skill]:
+    yield from fetch_skills(ALL_TIME_KEY, html)
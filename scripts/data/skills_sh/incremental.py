@@ -0,0 +1,185 @@
+"""Incremental rebuild of the core-domains outputs.
+
+Each curated skill is fingerprinted from the inputs `build_core_domains`
+actually reads (all-time / trending rows, the repo's star entry, the cached
+summary); a domain's fingerprint combines its definition with its skills'
+fingerprints. Only domains whose fingerprint differs from the manifest written
+by the previous run are rebuilt, and their sections are spliced into the
+existing JSON and Markdown outputs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .domains import CORE_DOMAINS
+from .enrich import Cache, build_core_domains
+from .parse import Skill, SkillKey
+
+FINGERPRINT_VERSION = 1
+
+Fingerprints = Dict[str, Any]
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _row(row: Optional[Skill]) -> Optional[Dict[str, Any]]:
+    if row is None:
+        return None
+    return {"name": row.get("name"), "installs": row.get("installs")}
+
+
+def _summary_key(item: Mapping[str, Any]) -> str:
+    return f"{item['source']}/{item['skillId']}"
+
+
+def missing_summaries(domain: Mapping[str, Any], summary_cache: Cache) -> bool:
+    """True if any skill in `domain` has no usable cached summary.
+
+    `get_skill_summary` refetches these on every full run, so the incremental
+    path must rebuild their domain too instead of trusting the fingerprint.
+    """
+    for item in domain["skills"]:
+        cached = summary_cache["summaries"].get(_summary_key(item))
+        if not (cached and cached.get("summary")):
+            return True
+    return False
+
+
+def skill_fingerprint(
+    item: Mapping[str, Any],
+    all_time_map: Mapping[SkillKey, Skill],
+    trending_map: Mapping[SkillKey, Skill],
+    star_cache: Cache,
+    summary_cache: Cache,
+    skip_summaries: bool = False,
+) -> str:
+    key = (item["source"], item["skillId"])
+    summary = None
+    if not skip_summaries:
+        cached = summary_cache["summaries"].get(_summary_key(item))
+        summary = cached.get("summary") if cached else None
+    return _digest(
+        {
+            "item": item,
+            "allTime": _row(all_time_map.get(key)),
+            "trending": _row(trending_map.get(key)),
+            "stars": star_cache["repos"].get(item["source"]),
+            "summary": summary,
+        }
+    )
+
+
+def domain_fingerprint(domain: Mapping[str, Any], skill_fingerprints: Iterable[str]) -> str:
+    definition = {key: domain[key] for key in ("id", "name", "focus")}
+    return _digest({"domain": definition, "skills": list(skill_fingerprints)})
+
+
+def fingerprint_domains(
+    domains: Iterable[Mapping[str, Any]],
+    all_time_map: Mapping[SkillKey, Skill],
+    trending_map: Mapping[SkillKey, Skill],
+    star_cache: Cache,
+    summary_cache: Cache,
+    skip_summaries: bool = False,
+) -> Dict[str, str]:
+    output = {}
+    for domain in domains:
+        skill_fingerprints = [
+            skill_fingerprint(
+                item, all_time_map, trending_map, star_cache, summary_cache, skip_summaries
+            )
+            for item in domain["skills"]
+        ]
+        output[domain["id"]] = domain_fingerprint(domain, skill_fingerprints)
+    return output
+
+
+def fingerprint_manifest(
+    domain_fingerprints: Dict[str, str],
+    skip_summaries: Optional[bool],
+    skip_public: Optional[bool] = None,
+) -> Fingerprints:
+    return {
+        "version": FINGERPRINT_VERSION,
+        "skipSummaries": skip_summaries,
+        "skipPublic": skip_public,
+        "domains": domain_fingerprints,
+    }
+
+
+def load_fingerprints(path: Path) -> Fingerprints:
+    if path.exists():
+        with path.open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if manifest.get("version") == FINGERPRINT_VERSION:
+            return manifest
+    return fingerprint_manifest({}, skip_summaries=None)
+
+
+def build_core_domains_incremental(
+    previous_payload: Optional[Dict[str, Any]],
+    previous_fingerprints: Fingerprints,
+    all_time_map: Mapping[SkillKey, Skill],
+    trending_map: Mapping[SkillKey, Skill],
+    star_cache: Cache,
+    summary_cache: Cache,
+    skip_summaries: bool = False,
+    refresh_summaries: bool = False,
+    summary_sleep_seconds: float = 0.3,
+    domains: Iterable[Mapping[str, Any]] = CORE_DOMAINS,
+) -> Tuple[List[Dict[str, Any]], List[str], Fingerprints]:
+    """Return `(domains, rebuilt_ids, fingerprints)`.
+
+    Unchanged domains are copied from `previous_payload`; a missing payload,
+    a changed `skip_summaries` mode or `refresh_summaries` rebuilds everything.
+    Domains with a missing summary are rebuilt so the fetch is retried.
+    """
+    domains = list(domains)
+    previous_domains = {}
+    if previous_payload is not None:
+        previous_domains = {domain["id"]: domain for domain in previous_payload["domains"]}
+    known = previous_fingerprints["domains"]
+    if refresh_summaries or previous_fingerprints.get("skipSummaries") != skip_summaries:
+        known = {}
+
+    current = fingerprint_domains(
+        domains, all_time_map, trending_map, star_cache, summary_cache, skip_summaries
+    )
+    stale = [
+        domain
+        for domain in domains
+        if domain["id"] not in previous_domains
+        or known.get(domain["id"]) != current[domain["id"]]
+        or (not skip_summaries and missing_summaries(domain, summary_cache))
+    ]
+    rebuilt = {
+        domain["id"]: domain
+        for domain in build_core_domains(
+            all_time_map,
+            trending_map,
+            star_cache,
+            summary_cache,
+            skip_summaries=skip_summaries,
+            refresh_summaries=refresh_summaries,
+            summary_sleep_seconds=summary_sleep_seconds,
+            domains=stale,
+        )
+    }
+    # Rebuilding may have fetched summaries; record the post-build inputs so
+    # the next run compares against what was actually written.
+    current.update(
+        fingerprint_domains(
+            stale, all_time_map, trending_map, star_cache, summary_cache, skip_summaries
+        )
+    )
+
+    output = [rebuilt.get(domain["id"]) or previous_domains[domain["id"]] for domain in domains]
+    rebuilt_ids = [domain["id"] for domain in stale]
+    return output, rebuilt_ids, fingerprint_manifest(current, skip_summaries)
@@ -0,0 +1,102 @@
+"""Read previously written outputs without loading them whole.
+
+`skills-all-time.json` and `skills-trending.json` are multi-MB top-level
+arrays, so `iter_json_array` decodes them one element at a time from a
+fixed-size read buffer.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from .constants import (
+    ALL_TIME_FILE,
+    CORE_DOMAINS_FILE,
+    DEFAULT_OUTPUT_DIR,
+    TRENDING_FILE,
+)
+from .parse import Skill
+
+PathLike = Union[str, Path]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_CHUNK_SIZE = 1 << 16
+
+
+def iter_json_array(path: PathLike, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    with Path(path).open("r", encoding="utf-8") as handle:
+        buffer = ""
+        pos = 0
+        eof = False
+        expect_item = True
+        started = False
+
+        def refill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                if not refill():
+                    raise ValueError(f"unexpected end of JSON array: {path}")
+                continue
+            ch = buffer[pos]
+            if not started:
+                if ch != "[":
+                    raise ValueError(f"expected a top-level JSON array: {path}")
+                started = True
+                pos += 1
+                continue
+            if ch == "]":
+                return
+            if ch == ",":
+                if expect_item:
+                    raise ValueError(f"unexpected ',' in JSON array: {path}")
+                expect_item = True
+                pos += 1
+                continue
+            if not expect_item:
+                raise ValueError(f"expected ',' or ']' in JSON array: {path}")
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof or not refill():
+                    raise
+                continue
+            # Numbers cut at the buffer edge ("3." / "3.5e") still decode, so
+            # only accept an item once its delimiter is in the buffer.
+            after = _WHITESPACE.match(buffer, end).end()
+            if (after >= len(buffer) or buffer[after] not in ",]") and not eof and refill():
+                continue
+            pos = end
+            expect_item = False
+            yield item
+
+
+def iter_output_skills(
+    kind: str = "trending", output_dir: PathLike = DEFAULT_OUTPUT_DIR
+) -> Iterator[Skill]:
+    """Stream skills from a previous run's `skills-<kind>.json`."""
+    filenames = {"trending": TRENDING_FILE, "all-time": ALL_TIME_FILE}
+    if kind not in filenames:
+        raise ValueError(f"unknown skills output: {kind}")
+    return iter_json_array(Path(output_dir) / filenames[kind])
+
+
+def load_core_domains(output_dir: PathLike = DEFAULT_OUTPUT_DIR) -> Optional[Dict[str, Any]]:
+    path = Path(output_dir) / CORE_DOMAINS_FILE
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
@@ -0,0 +1,71 @@
+"""Parse the skills arrays embedded in the skills.sh trending page."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .constants import BASE_URL
+
+Skill = Dict[str, Any]
+SkillKey = Tuple[str, str]
+
+
+def skill_key(skill: Skill) -> SkillKey:
+    return (skill["source"], skill["skillId"])
+
+
+def extract_array(html: str, key: str) -> str:
+    start = html.find(key)
+    if start == -1:
+        raise RuntimeError(f"missing key: {key}")
+    idx = html.find("[", start)
+    if idx == -1:
+        raise RuntimeError(f"missing array for key: {key}")
+    depth = 0
+    for i in range(idx, len(html)):
+        ch = html[i]
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return html[idx : i + 1]
+    raise RuntimeError(f"unterminated array for key: {key}")
+
+
+def parse_skills(html: str, key: str) -> List[Skill]:
+    raw = extract_array(html, key)
+    decoded = raw.encode("utf-8").decode("unicode_escape")
+    return json.loads(decoded)
+
+
+def iter_skills(html: str, key: str) -> Iterator[Skill]:
+    yield from parse_skills(html, key)
+
+
+def dedupe_skills(skills: Iterable[Skill]) -> List[Skill]:
+    deduped: Dict[SkillKey, Skill] = {}
+    for skill in skills:
+        key = skill_key(skill)
+        existing = deduped.get(key)
+        if existing is None or skill["installs"] > existing["installs"]:
+            deduped[key] = skill
+    return sorted(deduped.values(), key=lambda item: item["installs"], reverse=True)
+
+
+def iter_with_urls(skills: Iterable[Skill]) -> Iterator[Skill]:
+    for skill in skills:
+        entry = dict(skill)
+        entry["repo"] = skill["source"]
+        entry["skillUrl"] = f"{BASE_URL}/{skill['source']}/{skill['skillId']}"
+        entry["repoUrl"] = f"https://github.com/{skill['source']}"
+        yield entry
+
+
+def add_urls(skills: Iterable[Skill]) -> List[Skill]:
+    return list(iter_with_urls(skills))
+
+
+def index_skills(skills: Iterable[Skill]) -> Dict[SkillKey, Skill]:
+    return {skill_key(skill): skill for skill in skills}
@@ -0,0 +1,106 @@
+"""Render and write the core-domains outputs and their public copies."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from .constants import CORE_DOMAINS_FILE, PUBLIC_DATA_DIRS, TRENDING_URL
+
+
+def write_json(path: Path, payload: Any) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, ensure_ascii=True, indent=2)
+
+
+def write_text(path: Path, text: str) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+def publish_core_domains(payload: Dict[str, Any], public_dirs: Iterable[Path] = PUBLIC_DATA_DIRS) -> None:
+    for public_dir in public_dirs:
+        public_dir.mkdir(parents=True, exist_ok=True)
+        write_json(public_dir / CORE_DOMAINS_FILE, payload)
+
+
+def render_markdown_header(core_data: Dict[str, Any]) -> str:
+    lines = []
+    lines.append("# Skills.sh Core Domains (SKILL.md Summary Edition)")
+    lines.append("")
+    lines.append(f"Data source: {TRENDING_URL}")
+    lines.append(f"Generated at: {core_data['generatedAt']}")
+    lines.append("")
+    lines.append("Notes:")
+    lines.append("- Stars come from the GitHub API; `null` indicates fetch failure or rate limiting.")
+    lines.append("- Summaries come from the first SKILL.md paragraph on skills.sh; failures show as \"SKILL.md summary unavailable\".")
+    lines.append("- Domains and tags are curated and will evolve with user feedback.")
+    lines.append("")
+    lines.append("Full datasets:")
+    lines.append("- `data/skills-sh/skills-all-time.json`")
+    lines.append("- `data/skills-sh/skills-trending.json`")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_domain_markdown(domain: Dict[str, Any]) -> str:
+    lines = []
+    lines.append(f"## {domain['name']}")
+    lines.append("")
+    lines.append(domain["focus"])
+    lines.append("")
+    lines.append("| Skill | Repo | Installs (all-time) | Installs (24h) | Stars | Tags | Summary |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+    for skill in domain["skills"]:
+        tags = ", ".join(skill["tags"])
+        installs_all = skill["installsAllTime"] or "-"
+        installs_trending = skill["installsTrending"] or "-"
+        stars = skill["repoStars"] if skill["repoStars"] is not None else "-"
+        skill_link = f"[{skill['name']}]({skill['skillUrl']})"
+        repo_link = f"[{skill['source']}]({skill['repoUrl']})"
+        summary = skill["summary"].replace("|", "\\|")
+        lines.append(
+            f"| {skill_link} | {repo_link} | {installs_all} | {installs_trending} | {stars} | {tags} | {summary} |"
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_markdown(core_data: Dict[str, Any]) -> str:
+    parts = [render_markdown_header(core_data)]
+    parts.extend(render_domain_markdown(domain) for domain in core_data["domains"])
+    return "\n".join(parts)
+
+
+def split_markdown_sections(markdown: str) -> Dict[str, str]:
+    """Map each `## <name>` heading in a rendered file to its section text."""
+    sections: Dict[str, str] = {}
+    name = None
+    lines: List[str] = []
+    for line in markdown.split("\n"):
+        if line.startswith("## "):
+            if name is not None:
+                sections[name] = "\n".join(lines)
+            name = line[3:]
+            lines = []
+        if name is not None:
+            lines.append(line)
+    if name is not None:
+        sections[name] = "\n".join(lines)
+    return sections
+
+
+def splice_markdown(
+    core_data: Dict[str, Any], rebuilt_ids: Iterable[str], existing_markdown: str
+) -> str:
+    """Re-render the header and rebuilt domains; keep other sections verbatim."""
+    rebuilt = set(rebuilt_ids)
+    sections = split_markdown_sections(existing_markdown)
+    parts = [render_markdown_header(core_data)]
+    for domain in core_data["domains"]:
+        section = sections.get(domain["name"])
+        if domain["id"] in rebuilt or section is None:
+            section = render_domain_markdown(domain)
+        parts.append(section)
+    return "\n".join(parts)
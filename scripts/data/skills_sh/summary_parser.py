@@ -0,0 +1,56 @@
+"""Extract the first SKILL.md paragraph from a rendered skills.sh page."""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import List, Optional
+
+
+class SkillSummaryParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_prose = False
+        self.prose_depth = 0
+        self.in_paragraph = False
+        self.current_text: List[str] = []
+        self.paragraphs: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        if (
+            tag == "div"
+            and not self.in_prose
+            and "class" in attrs_dict
+            and "prose" in attrs_dict["class"]
+        ):
+            self.in_prose = True
+            self.prose_depth = 1
+            return
+        if self.in_prose:
+            self.prose_depth += 1
+            if tag == "p":
+                self.in_paragraph = True
+                self.current_text = []
+
+    def handle_endtag(self, tag):
+        if not self.in_prose:
+            return
+        if tag == "p" and self.in_paragraph:
+            text = " ".join("".join(self.current_text).split())
+            if text:
+                self.paragraphs.append(text)
+            self.in_paragraph = False
+            self.current_text = []
+        self.prose_depth -= 1
+        if self.prose_depth == 0:
+            self.in_prose = False
+
+    def handle_data(self, data):
+        if self.in_prose and self.in_paragraph:
+            self.current_text.append(data)
+
+
+def first_paragraph(html: str) -> Optional[str]:
+    parser = SkillSummaryParser()
+    parser.feed(html)
+    return parser.paragraphs[0] if parser.paragraphs else None